@@ -0,0 +1,76 @@
+"""
+配置解析缓存模块
+进程内共享已解析的YAML配置，按 (路径, 修改时间) 缓存，避免重复解析
+缓存的配置为只读快照，可在多线程间安全共享
+"""
+
+import logging
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Tuple
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+logger = logging.getLogger(__name__)
+
+# 解析结果缓存: 绝对路径 -> (st_mtime_ns, 只读配置)
+_parsed_cache: Dict[Path, Tuple[int, Mapping[str, Any]]] = {}
+_cache_lock = threading.Lock()
+
+
+def _freeze(value: Any) -> Any:
+    """
+    递归冻结配置对象：字典转为只读映射，列表转为元组
+
+    Args:
+        value: YAML解析得到的对象
+
+    Returns:
+        Any: 只读的配置对象
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def get_parsed_config(path: Path) -> Mapping[str, Any]:
+    """
+    获取已解析的配置，文件未修改时直接返回缓存结果
+
+    Args:
+        path: 配置文件路径
+
+    Returns:
+        Mapping[str, Any]: 只读配置映射（文件为空时为None）
+
+    Raises:
+        FileNotFoundError: 配置文件不存在
+        yaml.YAMLError: 配置文件格式错误
+    """
+    key = Path(path).resolve()
+    mtime_ns = key.stat().st_mtime_ns
+
+    cached = _parsed_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    with _cache_lock:
+        cached = _parsed_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        with open(key, 'r', encoding='utf-8') as file:
+            config = _freeze(yaml.load(file, Loader=_SafeLoader))
+
+        # 先构建完整的新快照，再一次性发布
+        _parsed_cache[key] = (mtime_ns, config)
+        logger.info("配置文件解析完成: %s", key)
+        return config
@@ -7,7 +7,34 @@ import yaml
 import os
 from pathlib import Path
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Any, Mapping, Callable, Dict, Tuple
+
+from ._cache import get_parsed_config
+from .sql_config import DatabaseConfigError
+
+logger = logging.getLogger(__name__)
+
+
+class _snapshot_property:
+    """
+    与配置快照绑定的缓存属性
+    
+    派生值与计算时所用的快照一同缓存，快照被替换后自动重新计算，
+    基于旧快照计算的结果只会写入旧快照的缓存，不会残留到新快照
+    """
+    
+    def __init__(self, func: Callable[[Any, Mapping[str, Any]], Any]):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+    
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+    
+    def __get__(self, instance: Optional['ConfigManager'], owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        return instance._get_derived(self.name, self.func)
 
 
 class ConfigManager:
@@ -17,27 +44,146 @@ class ConfigManager:
     
     def __init__(self, config_path: Optional[Path] = None):
         self.config_path = config_path or Path(__file__).parent / "config.yml"
-        self._config_cache: Optional[Dict[str, Any]] = None
+        # 只读配置快照，仅通过整体替换引用来更新
+        self._config_cache: Optional[Mapping[str, Any]] = None
+        # 派生值缓存: (计算所用的配置快照, 属性名 -> 派生值)，随快照整体替换
+        self._derived: Tuple[Optional[Mapping[str, Any]], Dict[str, Any]] = (None, {})
     
-    def load_config(self) -> Dict[str, Any]:
+    def _read_config(self) -> Mapping[str, Any]:
+        """
+        读取并解析配置文件
+        
+        Returns:
+            Mapping[str, Any]: 只读配置映射
+        """
+        try:
+            return get_parsed_config(self.config_path)
+        except FileNotFoundError:
+            logger.error("配置文件未找到: %s", self.config_path)
+            raise
+        except yaml.YAMLError as e:
+            logger.error("配置文件格式错误: %s", e)
+            raise
+    
+    def load_config(self) -> Mapping[str, Any]:
         """
         加载配置文件
         
+        每次调用比对配置文件的修改时间，文件未变更时直接返回当前快照，
+        变更后返回新快照，基于旧快照的派生值随之失效
+        
         Returns:
-            dict: 配置字典
-        """
-        if self._config_cache is None:
-            try:
-                with open(self.config_path, 'r', encoding='utf-8') as file:
-                    self._config_cache = yaml.safe_load(file)
-                    logging.info(f"配置文件加载成功: {self.config_path}")
-            except FileNotFoundError:
-                logging.error(f"配置文件未找到: {self.config_path}")
-                raise
-            except yaml.YAMLError as e:
-                logging.error(f"配置文件格式错误: {e}")
-                raise
-        return self._config_cache
+            Mapping[str, Any]: 只读配置映射
+        """
+        config = self._read_config()
+        if config is not self._config_cache:
+            if self._config_cache is None:
+                logger.info("配置文件加载成功: %s", self.config_path)
+            else:
+                logger.info("检测到配置文件变更，已重新加载: %s", self.config_path)
+            self._config_cache = config
+        return config
+    
+    def reload_config(self) -> None:
+        """
+        重新加载配置文件，新配置构建完成后原子替换旧快照并重新计算派生值
+        
+        配置文件变更会被自动检测，通常无需手动调用
+        """
+        logger.info("重新加载配置文件: %s", self.config_path)
+        self._config_cache = self._read_config()
+        self.invalidate()
+    
+    def invalidate(self) -> None:
+        """
+        清除由配置派生的缓存属性
+        """
+        self._derived = (None, {})
+    
+    def _get_derived(self, name: str, compute: Callable[[Any, Mapping[str, Any]], Any]) -> Any:
+        """
+        获取当前快照下的派生值，快照已替换时丢弃旧快照的全部派生值
+        
+        Args:
+            name: 派生属性名
+            compute: 由配置快照计算派生值的函数
+        
+        Returns:
+            Any: 派生值
+        """
+        config = self.load_config()
+        snapshot, values = self._derived
+        if snapshot is not config:
+            values = {}
+            self._derived = (config, values)
+        
+        if name not in values:
+            values[name] = compute(self, config)
+        return values[name]
+    
+    @_snapshot_property
+    def db_config(self, config: Mapping[str, Any]) -> Mapping[str, Any]:
+        """当前环境的数据库连接配置（缓存）"""
+        environment = config.get('environment', {}).get('current', 'development')
+        
+        try:
+            db_config = config['database'][environment]
+        except KeyError:
+            logger.error("未找到环境 '%s' 的数据库配置", environment)
+            raise DatabaseConfigError(f"未找到环境 '{environment}' 的数据库配置")
+        
+        logger.info("数据库配置加载成功: %s:%s", db_config['host'], db_config['port'])
+        return db_config
+    
+    @_snapshot_property
+    def table_name(self, config: Mapping[str, Any]) -> str:
+        """表名（缓存）"""
+        return config['database']['table_name']
+    
+    @_snapshot_property
+    def batch_size(self, config: Mapping[str, Any]) -> int:
+        """批处理大小（缓存）"""
+        return config.get('app', {}).get('batch_size', 100)
+    
+    @_snapshot_property
+    def copy_threshold(self, config: Mapping[str, Any]) -> int:
+        """改用COPY导入的数据量阈值（缓存）"""
+        return config.get('app', {}).get('copy_threshold', 10000)
+    
+    @_snapshot_property
+    def connection_pool_config(self, config: Mapping[str, Any]) -> Mapping[str, Any]:
+        """连接池配置（缓存）"""
+        return config.get('app', {}).get('connection_pool', {
+            'min_connections': 2,
+            'max_connections': 10,
+            'reserved_connections': 1,
+            'connection_timeout': 30,
+            'idle_timeout': 300
+        })
+    
+    @_snapshot_property
+    def threading_config(self, config: Mapping[str, Any]) -> Mapping[str, Any]:
+        """多线程配置（缓存）"""
+        return config.get('app', {}).get('threading', {
+            'max_workers': 4,
+            'chunk_size': 1000,
+            'max_prepared_statements': 8,
+            'enable_threading': False
+        })
+    
+    @_snapshot_property
+    def threading_enabled(self, config: Mapping[str, Any]) -> bool:
+        """是否启用多线程（缓存）"""
+        return config.get('app', {}).get('threading', {}).get('enable_threading', False)
+    
+    def get_db_config(self) -> Mapping[str, Any]:
+        """
+        获取当前环境的数据库连接配置
+        
+        Returns:
+            Mapping[str, Any]: 数据库连接配置
+        """
+        return self.db_config
     
     def get_table_name(self) -> str:
         """
@@ -46,8 +192,7 @@ class ConfigManager:
         Returns:
             str: 表名
         """
-        config = self.load_config()
-        return config['database']['table_name']
+        return self.table_name
     
     def get_log_level(self) -> str:
         """
@@ -66,37 +211,34 @@ class ConfigManager:
         Returns:
             int: 批处理大小
         """
-        config = self.load_config()
-        return config.get('app', {}).get('batch_size', 100)
+        return self.batch_size
+    
+    def get_copy_threshold(self) -> int:
+        """
+        获取改用COPY导入的数据量阈值配置
+        
+        Returns:
+            int: 数据量超过该值时使用COPY导入
+        """
+        return self.copy_threshold
     
-    def get_connection_pool_config(self) -> Dict[str, Any]:
+    def get_connection_pool_config(self) -> Mapping[str, Any]:
         """
         获取连接池配置
         
         Returns:
-            Dict[str, Any]: 连接池配置字典
+            Mapping[str, Any]: 连接池配置
         """
-        config = self.load_config()
-        return config.get('app', {}).get('connection_pool', {
-            'min_connections': 2,
-            'max_connections': 10,
-            'connection_timeout': 30,
-            'idle_timeout': 300
-        })
+        return self.connection_pool_config
     
-    def get_threading_config(self) -> Dict[str, Any]:
+    def get_threading_config(self) -> Mapping[str, Any]:
         """
         获取多线程配置
         
         Returns:
-            Dict[str, Any]: 多线程配置字典
+            Mapping[str, Any]: 多线程配置
         """
-        config = self.load_config()
-        return config.get('app', {}).get('threading', {
-            'max_workers': 4,
-            'chunk_size': 1000,
-            'enable_threading': False
-        })
+        return self.threading_config
     
     def is_threading_enabled(self) -> bool:
         """
@@ -105,5 +247,4 @@ class ConfigManager:
         Returns:
             bool: 是否启用多线程
         """
-        threading_config = self.get_threading_config()
-        return threading_config.get('enable_threading', False)
\ No newline at end of file
+        return self.threading_enabled
\ No newline at end of file
@@ -6,10 +6,12 @@
 import logging
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, Mapping, Optional
 
 import yaml
 
+from ._cache import get_parsed_config
+
 # 配置日志
 logger = logging.getLogger(__name__)
 
@@ -27,45 +29,68 @@ class DatabaseConfigLoader:
         初始化配置加载器
         
         Args:
-            config_path: 配置文件路径，默认为当前目录下的config.yml
+            config_path: 配置文件路径，默认为config包目录下的config.yml
         """
         if config_path is None:
-            config_path = Path("config.yml")
+            config_path = Path(__file__).parent / "config.yml"
         
         self.config_path = Path(config_path)
-        self._config_cache: Optional[Dict[str, Any]] = None
+        # 只读配置快照，仅通过整体替换引用来更新
+        self._config_cache: Optional[Mapping[str, Any]] = None
+        # 快照对应的配置文件修改时间，与当前文件不一致时自动重新加载
+        self._cached_mtime: Optional[int] = None
         
-        logger.info(f"初始化数据库配置加载器，配置文件路径: {self.config_path}")
+        logger.info("初始化数据库配置加载器，配置文件路径: %s", self.config_path)
     
-    def _load_yaml_config(self) -> Dict[str, Any]:
+    def _load_yaml_config(self) -> Mapping[str, Any]:
         """加载YAML配置文件"""
         try:
             if not self.config_path.exists():
                 raise DatabaseConfigError(f"配置文件不存在: {self.config_path}")
             
-            with open(self.config_path, 'r', encoding='utf-8') as file:
-                config = yaml.safe_load(file)
-                
+            config = get_parsed_config(self.config_path)
+            
             if not config:
                 raise DatabaseConfigError("配置文件为空或格式错误")
                 
-            logger.debug(f"成功加载配置文件: {self.config_path}")
+            logger.debug("成功加载配置文件: %s", self.config_path)
             return config
             
         except yaml.YAMLError as e:
-            logger.error(f"YAML配置文件解析错误: {e}")
+            logger.error("YAML配置文件解析错误: %s", e)
             raise DatabaseConfigError(f"YAML配置文件解析错误: {e}")
         except Exception as e:
-            logger.error(f"加载配置文件失败: {e}")
+            logger.error("加载配置文件失败: %s", e)
             raise DatabaseConfigError(f"加载配置文件失败: {e}")
     
-    def get_config(self, force_reload: bool = False) -> Dict[str, Any]:
-        """获取配置，支持缓存"""
-        if self._config_cache is None or force_reload:
-            self._config_cache = self._load_yaml_config()
+    def invalidate(self) -> None:
+        """使缓存失效，下次获取配置时重新加载"""
+        self._cached_mtime = None
+    
+    def get_config(self, force_reload: bool = False) -> Mapping[str, Any]:
+        """获取配置，支持缓存，配置文件修改后自动重新加载"""
+        if force_reload:
+            self.invalidate()
+        
+        config = self._config_cache
+        try:
+            current_mtime = self.config_path.stat().st_mtime_ns
+        except OSError:
+            current_mtime = None
+        
+        if config is not None and current_mtime is None:
+            # 配置文件暂时不可访问时继续使用已加载的配置
+            logger.warning("配置文件不可访问，继续使用缓存配置: %s", self.config_path)
+            return config
+        
+        if config is None or current_mtime != self._cached_mtime:
+            # 先完整构建新快照，再原子替换引用，读取方无需加锁
+            config = self._load_yaml_config()
+            self._config_cache = config
+            self._cached_mtime = current_mtime
             logger.info("配置已加载到缓存")
         
-        return self._config_cache
+        return config
     
     def get_current_environment(self) -> str:
         """获取当前环境"""
@@ -73,13 +98,13 @@ class DatabaseConfigLoader:
         
         try:
             env = config['environment']['current']
-            logger.info(f"当前环境: {env}")
+            logger.info("当前环境: %s", env)
             return env
         except KeyError:
             logger.warning("配置文件中未找到环境设置，使用默认环境: development")
             return 'development'
     
-    def get_database_config(self, environment: Optional[str] = None) -> Dict[str, Any]:
+    def get_database_config(self, environment: Optional[str] = None) -> Mapping[str, Any]:
         """获取数据库配置"""
         config = self.get_config()
         
@@ -88,10 +113,10 @@ class DatabaseConfigLoader:
         
         try:
             db_config = config['database'][environment]
-            logger.info(f"获取 {environment} 环境数据库配置")
+            logger.info("获取 %s 环境数据库配置", environment)
             return db_config
         except KeyError:
-            logger.error(f"未找到环境 '{environment}' 的数据库配置")
+            logger.error("未找到环境 '%s' 的数据库配置", environment)
             raise DatabaseConfigError(f"未找到环境 '{environment}' 的数据库配置")
 
 
@@ -99,7 +124,7 @@ class DatabaseConfigLoader:
 _config_loader = DatabaseConfigLoader()
 
 
-def load_config(environment: Optional[str] = None) -> Dict[str, Any]:
+def load_config(environment: Optional[str] = None) -> Mapping[str, Any]:
     """
     加载数据库配置
     
@@ -107,7 +132,7 @@ def load_config(environment: Optional[str] = None) -> Dict[str, Any]:
         environment: 指定环境，如果为None则使用配置文件中的当前环境
         
     Returns:
-        数据库配置字典
+        数据库配置（只读映射）
         
     Raises:
         DatabaseConfigError: 配置加载失败时抛出
@@ -115,7 +140,7 @@ def load_config(environment: Optional[str] = None) -> Dict[str, Any]:
     try:
         return _config_loader.get_database_config(environment)
     except Exception as e:
-        logger.error(f"加载数据库配置失败: {e}")
+        logger.error("加载数据库配置失败: %s", e)
         raise
 
 
@@ -134,4 +159,4 @@ def reload_config() -> None:
     重新加载配置文件
     """
     logger.info("重新加载配置文件")
-    _config_loader.get_config(force_reload=True)
\ No newline at end of file
+    _config_loader.invalidate()
\ No newline at end of file
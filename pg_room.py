@@ -2,57 +2,115 @@
     python -m pg_room
 '''
 import psycopg2
-from psycopg2.extras import execute_batch
+import psycopg2.extensions
+from psycopg2.extras import execute_values
 from psycopg2 import pool
 from pathlib import Path
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Iterator, Union
 from contextlib import contextmanager
 import threading
+import weakref
+from collections import OrderedDict
+import atexit
+import io
+import math
+from decimal import Decimal
+from itertools import islice, count
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from config.sql_config import load_config as load_db_config
 from config.config_manager import ConfigManager
 
+logger = logging.getLogger(__name__)
+
+# 服务端预编译语句名称序号（同一会话内保证唯一）
+_prepared_statement_ids = count()
+
+# 预编译INSERT语句的缓存键: (表名, 列名元组, 每次执行的行数)
+_PreparedKey = Tuple[str, Tuple[str, ...], int]
+
 
 class ConnectionPoolManager:
     """
     连接池管理器，负责管理数据库连接池
+    
+    构造时即创建连接池（不建立连接），并在后台预热连接，使预热先于首次使用完成
     """
     
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(self, config_manager: ConfigManager, warm_up: bool = True):
         self.config_manager = config_manager
-        self._db_config: Optional[Dict[str, Any]] = None
         self._connection_pool: Optional[pool.ThreadedConnectionPool] = None
-        self._lock = threading.Lock()
+        self._initialize_pool()
+        if warm_up:
+            self._start_warm_up()
+    
+    def _initialize_pool(self) -> None:
+        """
+        初始化连接池
+        """
+        db_config = self.config_manager.db_config
+        pool_config = self.config_manager.get_connection_pool_config()
+        
+        # 以minconn=0创建，避免构造时同步建立全部连接
+        self._connection_pool = pool.ThreadedConnectionPool(
+            minconn=0,
+            maxconn=pool_config['max_connections'],
+            **db_config
+        )
+        # minconn同时决定归还时保留的空闲连接数，创建后恢复为配置值
+        self._connection_pool.minconn = pool_config['min_connections']
+        logger.info("连接池初始化成功: min=%s, max=%s", pool_config['min_connections'], pool_config['max_connections'])
+    
+    def _start_warm_up(self) -> None:
+        """
+        启动后台线程预热连接池
+        """
+        pool_config = self.config_manager.get_connection_pool_config()
+        # 预热期间连接处于借出状态，需为插入工作线程及保留连接留出足够的余量
+        max_workers = self.config_manager.get_threading_config()['max_workers']
+        warm_target = min(
+            pool_config['min_connections'],
+            self.get_worker_capacity() - max_workers
+        )
+        if warm_target > 0:
+            threading.Thread(
+                target=self._warm_connections,
+                args=(warm_target,),
+                daemon=True
+            ).start()
     
-    def _get_db_config(self) -> Dict[str, Any]:
+    def get_worker_capacity(self) -> int:
         """
-        获取数据库配置
+        获取可同时供插入工作线程使用的连接数
+        
+        连接池耗尽时getconn直接抛出PoolError而不会等待，因此需扣除为建表等操作保留的连接
         
         Returns:
-            dict: 数据库配置字典
+            int: 工作线程可用的连接数（至少为1）
         """
-        if self._db_config is None:
-            self._db_config = load_db_config()
-            logging.info(f"数据库配置加载成功: {self._db_config['host']}:{self._db_config['port']}")
-        return self._db_config
+        pool_config = self.config_manager.get_connection_pool_config()
+        reserved = pool_config.get('reserved_connections', 1)
+        return max(1, pool_config['max_connections'] - reserved)
     
-    def _initialize_pool(self) -> None:
+    def _warm_connections(self, target: int) -> None:
         """
-        初始化连接池
+        后台预热连接池，建立目标数量的空闲连接
+        
+        Args:
+            target: 目标预热连接数
         """
-        if self._connection_pool is None:
-            with self._lock:
-                if self._connection_pool is None:
-                    db_config = self._get_db_config()
-                    pool_config = self.config_manager.get_connection_pool_config()
-                    
-                    self._connection_pool = pool.ThreadedConnectionPool(
-                        minconn=pool_config['min_connections'],
-                        maxconn=pool_config['max_connections'],
-                        **db_config
-                    )
-                    logging.info(f"连接池初始化成功: min={pool_config['min_connections']}, max={pool_config['max_connections']}")
+        warmed = []
+        try:
+            for _ in range(target):
+                warmed.append(self._connection_pool.getconn())
+        except Exception as e:
+            logger.warning("连接池预热中断: %s", e)
+        finally:
+            for conn in warmed:
+                try:
+                    self._connection_pool.putconn(conn)
+                except Exception as e:
+                    logger.warning("预热连接归还失败: %s", e)
+        logger.debug("连接池预热完成: %s 个连接", len(warmed))
     
     @contextmanager
     def get_connection(self):
@@ -62,21 +120,20 @@ class ConnectionPoolManager:
         Yields:
             psycopg2.extensions.connection: 数据库连接
         """
-        self._initialize_pool()
         conn = None
         try:
             conn = self._connection_pool.getconn()
-            logging.debug("从连接池获取连接成功")
+            logger.debug("从连接池获取连接成功")
             yield conn
         except Exception as e:
             if conn:
                 conn.rollback()
-                logging.error(f"数据库操作失败，已回滚: {str(e)}")
+                logger.error("数据库操作失败，已回滚: %s", e)
             raise
         finally:
             if conn:
                 self._connection_pool.putconn(conn)
-                logging.debug("连接已归还到连接池")
+                logger.debug("连接已归还到连接池")
     
     def close_pool(self) -> None:
         """
@@ -84,29 +141,53 @@ class ConnectionPoolManager:
         """
         if self._connection_pool:
             self._connection_pool.closeall()
-            logging.info("连接池已关闭")
+            logger.info("连接池已关闭")
 
 
 class DatabaseManager:
     """
     数据库管理器，负责数据库连接和操作（单连接模式）
+    
+    连接在首次使用时建立并在多次操作间复用，直到调用close()
     """
     
     def __init__(self, config_manager: ConfigManager):
         self.config_manager = config_manager
-        self._db_config: Optional[Dict[str, Any]] = None
+        self._conn: Optional[psycopg2.extensions.connection] = None
+        # 单个连接同一时间只允许一个调用方使用，避免事务交错
+        self._lock = threading.Lock()
     
-    def _get_db_config(self) -> Dict[str, Any]:
+    def _ensure_connection(self) -> psycopg2.extensions.connection:
         """
-        获取数据库配置
+        获取可用的数据库连接，未建立、已关闭或状态未知时重新连接
+        
+        仅检查本地连接状态，不额外访问服务端；使用中出现连接异常时由get_connection丢弃连接
         
         Returns:
-            dict: 数据库配置字典
+            psycopg2.extensions.connection: 数据库连接
+        """
+        conn = self._conn
+        if conn is not None and not conn.closed:
+            if conn.info.transaction_status != psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+                return conn
+            self._discard_connection()
+        
+        db_config = self.config_manager.db_config
+        self._conn = psycopg2.connect(**db_config)
+        logger.info("数据库连接建立成功")
+        return self._conn
+    
+    def _discard_connection(self) -> None:
         """
-        if self._db_config is None:
-            self._db_config = load_db_config()
-            logging.info(f"数据库配置加载成功: {self._db_config['host']}:{self._db_config['port']}")
-        return self._db_config
+        丢弃失效的连接，下次使用时重新连接
+        """
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except psycopg2.Error:
+                pass
+            self._conn = None
+            logger.warning("数据库连接已失效，下次使用时将重新连接")
     
     @contextmanager
     def get_connection(self):
@@ -116,21 +197,37 @@ class DatabaseManager:
         Yields:
             psycopg2.extensions.connection: 数据库连接
         """
-        conn = None
-        try:
-            db_config = self._get_db_config()
-            conn = psycopg2.connect(**db_config)
-            logging.info("数据库连接建立成功")
-            yield conn
-        except Exception as e:
-            if conn:
-                conn.rollback()
-                logging.error(f"数据库操作失败，已回滚: {str(e)}")
-            raise
-        finally:
-            if conn:
-                conn.close()
-                logging.info("数据库连接已关闭")
+        with self._lock:
+            conn = None
+            try:
+                conn = self._ensure_connection()
+                yield conn
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                logger.error("数据库连接异常: %s", e)
+                self._discard_connection()
+                raise
+            except Exception as e:
+                if conn:
+                    conn.rollback()
+                    logger.error("数据库操作失败，已回滚: %s", e)
+                raise
+            finally:
+                # 结束未提交的事务，保证复用的连接处于空闲状态
+                if conn is not None and not conn.closed:
+                    try:
+                        conn.rollback()
+                    except psycopg2.Error:
+                        self._discard_connection()
+    
+    def close(self) -> None:
+        """
+        关闭数据库连接
+        """
+        with self._lock:
+            if self._conn is not None and not self._conn.closed:
+                self._conn.close()
+                logger.info("数据库连接已关闭")
+            self._conn = None
 
 
 class TableManager:
@@ -138,7 +235,7 @@ class TableManager:
     表管理器，负责表的创建和维护
     """
     
-    def __init__(self, db_manager: DatabaseManager, config_manager: ConfigManager):
+    def __init__(self, db_manager: Union[DatabaseManager, ConnectionPoolManager], config_manager: ConfigManager):
         self.db_manager = db_manager
         self.config_manager = config_manager
     
@@ -154,7 +251,7 @@ class TableManager:
         """
         if table_name is None:
             table_name = self.config_manager.get_table_name()
-            logging.info(f"从配置文件读取表名: {table_name}")
+            logger.info("从配置文件读取表名: %s", table_name)
         
         try:
             with self.db_manager.get_connection() as conn:
@@ -216,25 +313,163 @@ class TableManager:
                     f"COMMENT ON COLUMN {table_name}.updated_at IS '更新时间'"
                 ]
                 
-                # 执行创建表语句
-                cursor.execute(create_table_sql)
-                logging.info(f"表 {table_name} 创建SQL执行成功")
-                
-                # 执行添加注释语句
-                for comment_sql in comment_sqls:
-                    cursor.execute(comment_sql)
+                # 建表与注释语句合并为一次多语句执行，减少网络往返
+                cursor.execute(";\n".join([create_table_sql, *comment_sqls]))
+                logger.info("表 %s 创建SQL执行成功", table_name)
                 
                 conn.commit()
-                logging.info(f"表 {table_name} 创建成功")
-                print(f"表 {table_name} 创建成功")
+                logger.info("表 %s 创建成功", table_name)
                 return True
                 
         except Exception as e:
-            logging.error(f"创建表失败: {str(e)}")
-            print(f"创建表失败: {str(e)}")
+            logger.error("创建表失败: %s", e)
             return False
 
 
+def _build_insert_sql(target_table: str, columns: Tuple[str, ...]) -> str:
+    """
+    根据列名生成供execute_values使用的多行INSERT语句
+    
+    Args:
+        target_table: 目标表名
+        columns: 列名元组
+    
+    Returns:
+        str: INSERT SQL语句（VALUES后为单个%s占位符）
+    """
+    columns_str = ", ".join(columns)
+    return f"INSERT INTO {target_table} ({columns_str}) VALUES %s"
+
+
+def _dicts_to_tuples(room_list: List[Dict[str, Any]], columns: Tuple[str, ...]) -> List[Tuple[Any, ...]]:
+    """
+    按给定列顺序将字典行转换为元组行（缺失的列取None）
+    
+    Args:
+        room_list: 字典行列表
+        columns: 列名元组
+    
+    Returns:
+        List[Tuple[Any, ...]]: 元组行列表
+    """
+    return [tuple(row.get(col) for col in columns) for row in room_list]
+
+
+def _rows_to_tuples(room_list: List[Dict[str, Any]]) -> Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]:
+    """
+    以首行的键为列顺序，将字典行一次性转换为元组行（缺失的列取None）
+    
+    Args:
+        room_list: 字典行列表
+    
+    Returns:
+        Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]: 列名元组和元组行列表
+    """
+    columns = tuple(room_list[0])
+    return columns, _dicts_to_tuples(room_list, columns)
+
+
+def _copy_text_value(value: Any) -> str:
+    """
+    将单个值编码为COPY文本格式字段，编码结果与INSERT路径经psycopg2适配后存储的文本一致
+    
+    Args:
+        value: 字段值
+    
+    Returns:
+        str: 转义后的字段文本（None编码为\\N）
+    
+    Raises:
+        TypeError: 字段值不是COPY路径支持的标量类型
+    """
+    if value is None:
+        return "\\N"
+    # bool需先于int判断：psycopg2将其适配为true/false，而str()得到True/False
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "NaN"
+        if math.isinf(value):
+            return "Infinity" if value > 0 else "-Infinity"
+        return repr(value)
+    if isinstance(value, Decimal):
+        # psycopg2将非有限的Decimal统一适配为NaN
+        return str(value) if value.is_finite() else "NaN"
+    if isinstance(value, int):
+        return str(value)
+    if not isinstance(value, str):
+        raise TypeError(f"COPY导入不支持的字段类型: {type(value).__name__}")
+    return (
+        value
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _build_copy_buffer(rows: List[Tuple[Any, ...]]) -> io.StringIO:
+    """
+    将元组行编码为COPY文本格式的内存缓冲区
+    
+    Args:
+        rows: 按列顺序排列的元组行列表
+    
+    Returns:
+        io.StringIO: 已定位到起始位置的数据缓冲区
+    """
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(_copy_text_value(value) for value in row))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+def _copy_rows(cursor: psycopg2.extensions.cursor, target_table: str, columns: Tuple[str, ...], buffer: io.StringIO) -> None:
+    """
+    使用COPY FROM STDIN批量导入数据
+    
+    Args:
+        cursor: 数据库游标
+        target_table: 目标表名
+        columns: 列名元组
+        buffer: COPY文本格式的数据缓冲区
+    """
+    copy_sql = f"COPY {target_table} ({', '.join(columns)}) FROM STDIN"
+    cursor.copy_expert(copy_sql, buffer)
+
+
+class _ChunkFeeder:
+    """
+    线程安全的数据块分发器，多个工作线程共享同一个惰性数据块迭代器
+    """
+    
+    def __init__(self, chunks: Iterator[List[Dict[str, Any]]]):
+        self._chunks = chunks
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+    
+    def next_chunk(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        获取下一个数据块
+        
+        Returns:
+            Optional[List[Dict[str, Any]]]: 数据块，已取完或已停止时返回None
+        """
+        if self._stopped.is_set():
+            return None
+        with self._lock:
+            return next(self._chunks, None)
+    
+    def stop(self) -> None:
+        """
+        停止分发，其余工作线程不再领取新的数据块
+        """
+        self._stopped.set()
+
+
 class ThreadedDataManager:
     """
     多线程数据管理器，负责多线程数据插入和处理
@@ -243,63 +478,218 @@ class ThreadedDataManager:
     def __init__(self, connection_pool_manager: ConnectionPoolManager, config_manager: ConfigManager):
         self.connection_pool_manager = connection_pool_manager
         self.config_manager = config_manager
+        # 各连接上已预编译的INSERT语句: 连接 -> {缓存键: (语句名, EXECUTE语句)}，按最近使用排序
+        # 以弱引用为键，连接被关闭回收后记录随之释放
+        self._prepared_inserts: weakref.WeakKeyDictionary[
+            psycopg2.extensions.connection, OrderedDict[_PreparedKey, Tuple[str, str]]
+        ] = weakref.WeakKeyDictionary()
+        self._prepared_lock = threading.Lock()
+        # 线程池在多次插入调用间复用，避免反复创建和回收工作线程
+        self._executor = ThreadPoolExecutor(
+            max_workers=config_manager.get_threading_config()['max_workers'],
+            thread_name_prefix='agoda-insert'
+        )
+    
+    def close(self) -> None:
+        """
+        关闭线程池，等待已提交的任务完成
+        """
+        self._executor.shutdown(wait=True)
+        logger.info("插入线程池已关闭")
     
-    def _chunk_data(self, data: List[Dict[str, Any]], chunk_size: int) -> List[List[Dict[str, Any]]]:
+    def _chunk_data(self, data: List[Dict[str, Any]], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
         """
-        将数据分块
+        将数据惰性分块，按需生成每个数据块
         
         Args:
             data: 原始数据列表
             chunk_size: 每块大小
         
         Returns:
-            List[List[Dict[str, Any]]]: 分块后的数据列表
+            Iterator[List[Dict[str, Any]]]: 数据块迭代器
+        """
+        it = iter(data)
+        return iter(lambda: list(islice(it, chunk_size)), [])
+    
+    def _prepare_chunk(self, chunk: List[Dict[str, Any]], columns: Tuple[str, ...],
+                       use_copy: bool) -> Union[List[Tuple[Any, ...]], io.StringIO]:
+        """
+        将数据块转换为可直接写入的格式（纯CPU操作，无需占用连接）
+        
+        Args:
+            chunk: 字典行数据块
+            columns: 列名元组
+            use_copy: 是否使用COPY导入
+        
+        Returns:
+            Union[List[Tuple[Any, ...]], io.StringIO]: 元组行列表或COPY数据缓冲区
+        """
+        rows = _dicts_to_tuples(chunk, columns)
+        if use_copy:
+            return _build_copy_buffer(rows)
+        return rows
+    
+    def _get_prepared_insert(self, conn: psycopg2.extensions.connection, cursor: psycopg2.extensions.cursor,
+                             target_table: str, columns: Tuple[str, ...], row_count: int) -> str:
+        """
+        获取当前连接上预编译的多行INSERT语句，首次使用时执行PREPARE
+        
+        每个连接保留的语句数不超过max_prepared_statements，超出时释放最久未使用的语句
+        
+        Args:
+            conn: 数据库连接
+            cursor: 数据库游标
+            target_table: 目标表名
+            columns: 列名元组
+            row_count: 每次执行插入的行数
+        
+        Returns:
+            str: 带占位符的EXECUTE语句
+        """
+        with self._prepared_lock:
+            prepared_inserts = self._prepared_inserts.setdefault(conn, OrderedDict())
+        
+        key = (target_table, columns, row_count)
+        prepared = prepared_inserts.get(key)
+        if prepared is not None:
+            prepared_inserts.move_to_end(key)
+            return prepared[1]
+        
+        max_prepared = self.config_manager.get_threading_config().get('max_prepared_statements', 8)
+        while prepared_inserts and len(prepared_inserts) >= max_prepared:
+            _, (stale_name, _) = prepared_inserts.popitem(last=False)
+            cursor.execute(f"DEALLOCATE {stale_name}")
+            logger.debug("已释放最久未使用的预编译语句: %s", stale_name)
+        
+        column_count = len(columns)
+        values_sql = ", ".join(
+            "(" + ", ".join(f"${row * column_count + col + 1}" for col in range(column_count)) + ")"
+            for row in range(row_count)
+        )
+        statement_name = f"agoda_insert_{next(_prepared_statement_ids)}"
+        cursor.execute(
+            f"PREPARE {statement_name} AS INSERT INTO {target_table} ({', '.join(columns)}) VALUES {values_sql}"
+        )
+        execute_sql = f"EXECUTE {statement_name} ({', '.join(['%s'] * (row_count * column_count))})"
+        prepared_inserts[key] = (statement_name, execute_sql)
+        logger.debug("连接已预编译INSERT语句: %s", statement_name)
+        return execute_sql
+    
+    def _deallocate_prepared(self, conn: psycopg2.extensions.connection) -> None:
+        """
+        释放连接上的预编译语句并清除记录，避免长期存活的池化连接上残留语句
+        
+        Args:
+            conn: 数据库连接
+        """
+        with self._prepared_lock:
+            prepared_inserts = self._prepared_inserts.pop(conn, None)
+        if not prepared_inserts:
+            return
+        
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("DEALLOCATE ALL")
+            conn.commit()
+            logger.debug("已释放连接上的预编译语句: %s 个", len(prepared_inserts))
+        except psycopg2.Error as e:
+            logger.warning("释放预编译语句失败: %s", e)
+    
+    def _write_chunk(self, conn: psycopg2.extensions.connection, cursor: psycopg2.extensions.cursor,
+                     payload: Union[List[Tuple[Any, ...]], io.StringIO], target_table: str,
+                     insert_sql: str, columns: Tuple[str, ...], use_copy: bool) -> None:
+        """
+        在当前事务中写入单个已转换的数据块（不提交）
+        
+        整页数据使用连接上预编译的多行INSERT语句执行，不足一页的剩余数据使用execute_values
+        
+        Args:
+            conn: 数据库连接
+            cursor: 数据库游标
+            payload: 元组行列表或COPY数据缓冲区
+            target_table: 目标表名
+            insert_sql: 预先生成的INSERT语句
+            columns: 列名元组
+            use_copy: 是否使用COPY导入
         """
-        return [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+        if use_copy:
+            _copy_rows(cursor, target_table, columns, payload)
+            return
+        
+        batch_size = self.config_manager.batch_size
+        full_pages_end = len(payload) - len(payload) % batch_size
+        
+        if full_pages_end:
+            execute_sql = self._get_prepared_insert(conn, cursor, target_table, columns, batch_size)
+        
+        for start in range(0, full_pages_end, batch_size):
+            page = payload[start:start + batch_size]
+            cursor.execute(execute_sql, [value for row in page for value in row])
+        
+        if full_pages_end < len(payload):
+            execute_values(
+                cursor,
+                insert_sql,
+                payload[full_pages_end:],
+                page_size=batch_size
+            )
     
-    def _insert_chunk(self, chunk: List[Dict[str, Any]], target_table: str, thread_id: int) -> int:
+    def _insert_stripe(self, feeder: _ChunkFeeder, target_table: str, thread_id: int,
+                       insert_sql: str, columns: Tuple[str, ...], use_copy: bool = False) -> int:
         """
-        插入单个数据块
+        工作线程：使用单个连接持续领取并写入数据块，全部写入后统一提交一次
         
         Args:
-            chunk: 数据块
+            feeder: 数据块分发器
             target_table: 目标表名
             thread_id: 线程ID
+            insert_sql: 预先生成的INSERT语句
+            columns: 列名元组
+            use_copy: 是否使用COPY导入
         
         Returns:
             int: 插入的记录数
         """
-        if not chunk:
+        chunk = feeder.next_chunk()
+        if chunk is None:
             return 0
         
-        batch_size = self.config_manager.get_batch_size()
+        # 首个数据块在获取连接前完成转换，缩短连接占用时间
+        try:
+            payload = self._prepare_chunk(chunk, columns, use_copy)
+        except Exception as e:
+            feeder.stop()
+            logger.error("线程 %s: 数据转换失败: %s", thread_id, e)
+            raise
         
-        with self.connection_pool_manager.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # 动态生成占位符
-            columns = list(chunk[0].keys())
-            placeholders = [f"%({col})s" for col in columns]
-            
-            insert_sql = f"""
-                INSERT INTO {target_table} ({', '.join(columns)})
-                VALUES ({', '.join(placeholders)})
-            """
-            
-            try:
-                execute_batch(
-                    cursor,
-                    insert_sql,
-                    chunk,
-                    page_size=batch_size
-                )
-                conn.commit()
-                logging.info(f"线程 {thread_id}: 成功插入 {len(chunk)} 条数据到表 {target_table}")
-                return len(chunk)
-            except Exception as e:
-                conn.rollback()
-                logging.error(f"线程 {thread_id}: 数据插入失败: {str(e)}")
-                raise
+        inserted = 0
+        
+        try:
+            with self.connection_pool_manager.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                try:
+                    while chunk is not None:
+                        self._write_chunk(conn, cursor, payload, target_table, insert_sql, columns, use_copy)
+                        inserted += len(chunk)
+                        
+                        chunk = feeder.next_chunk()
+                        if chunk is not None:
+                            payload = self._prepare_chunk(chunk, columns, use_copy)
+                    
+                    conn.commit()
+                    logger.info("线程 %s: 成功插入 %s 条数据到表 %s", thread_id, inserted, target_table)
+                    return inserted
+                except Exception as e:
+                    feeder.stop()
+                    conn.rollback()
+                    self._deallocate_prepared(conn)
+                    logger.error("线程 %s: 数据插入失败: %s", thread_id, e)
+                    raise
+        except Exception:
+            # 获取连接失败时已领取的数据块同样无法写入，需停止分发
+            feeder.stop()
+            raise
     
     def insert_raw_data_threaded(self, room_list: List[Dict[str, Any]], target_table: str) -> bool:
         """
@@ -313,47 +703,56 @@ class ThreadedDataManager:
             bool: 插入是否成功
         """
         if not room_list:
-            logging.warning("房间数据列表为空，跳过插入操作")
-            print("房间数据列表为空，跳过插入操作")
+            logger.warning("房间数据列表为空，跳过插入操作")
             return True
         
         threading_config = self.config_manager.get_threading_config()
         max_workers = threading_config['max_workers']
         chunk_size = threading_config['chunk_size']
         
-        # 分块数据
-        chunks = self._chunk_data(room_list, chunk_size)
+        # 列顺序只需确定一次，各数据块由工作线程领取后再转换为元组行
+        columns = tuple(room_list[0])
+        
+        # 分块数据（惰性生成），由各工作线程按需领取
+        chunk_count = -(-len(room_list) // chunk_size)
+        feeder = _ChunkFeeder(self._chunk_data(room_list, chunk_size))
+        # 工作线程数不超过连接池可供插入使用的连接数，为表操作保留连接
+        worker_count = min(max_workers, chunk_count, self.connection_pool_manager.get_worker_capacity())
         total_inserted = 0
         
-        logging.info(f"开始多线程插入: {len(room_list)} 条数据，分为 {len(chunks)} 块，使用 {max_workers} 个线程")
-        print(f"开始多线程插入: {len(room_list)} 条数据，分为 {len(chunks)} 块，使用 {max_workers} 个线程")
+        # 数据结构一致，INSERT语句只需生成一次
+        insert_sql = _build_insert_sql(target_table, columns)
+        # 数据量较大时每个数据块改用COPY导入
+        use_copy = len(room_list) > self.config_manager.copy_threshold
+        
+        logger.info("开始多线程插入: %s 条数据，分为 %s 块，使用 %s 个线程", len(room_list), chunk_count, worker_count)
         
         try:
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # 提交所有任务
-                future_to_chunk = {
-                    executor.submit(self._insert_chunk, chunk, target_table, i): (chunk, i)
-                    for i, chunk in enumerate(chunks)
-                }
-                
-                # 处理完成的任务
-                for future in as_completed(future_to_chunk):
-                    chunk, thread_id = future_to_chunk[future]
-                    try:
-                        inserted_count = future.result()
-                        total_inserted += inserted_count
-                    except Exception as e:
-                        logging.error(f"线程 {thread_id} 执行失败: {str(e)}")
-                        print(f"线程 {thread_id} 执行失败: {str(e)}")
-                        return False
+            # 每个工作线程占用一个连接、一个事务
+            future_to_worker = {
+                self._executor.submit(self._insert_stripe, feeder, target_table, i, insert_sql, columns, use_copy): i
+                for i in range(worker_count)
+            }
+            
+            # 处理完成的任务（出错时仍等待其余线程结束后再返回）
+            success = True
+            for future in as_completed(future_to_worker):
+                thread_id = future_to_worker[future]
+                try:
+                    inserted_count = future.result()
+                    total_inserted += inserted_count
+                except Exception as e:
+                    logger.error("线程 %s 执行失败: %s", thread_id, e)
+                    success = False
+            
+            if not success:
+                return False
             
-            logging.info(f"多线程插入完成: 总共插入 {total_inserted} 条数据到表 {target_table}")
-            print(f"多线程插入完成: 总共插入 {total_inserted} 条数据到表 {target_table}")
+            logger.info("多线程插入完成: 总共插入 %s 条数据到表 %s", total_inserted, target_table)
             return True
             
         except Exception as e:
-            logging.error(f"多线程插入失败: {str(e)}")
-            print(f"多线程插入失败: {str(e)}")
+            logger.error("多线程插入失败: %s", e)
             return False
 
 
@@ -365,6 +764,25 @@ class DataManager:
     def __init__(self, db_manager: DatabaseManager, config_manager: ConfigManager):
         self.db_manager = db_manager
         self.config_manager = config_manager
+        self._insert_sql_cache: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+    
+    def _get_insert_sql(self, target_table: str, columns: Tuple[str, ...]) -> str:
+        """
+        获取INSERT语句，按 (表名, 列名) 缓存
+        
+        Args:
+            target_table: 目标表名
+            columns: 列名元组
+        
+        Returns:
+            str: INSERT SQL语句
+        """
+        key = (target_table, columns)
+        insert_sql = self._insert_sql_cache.get(key)
+        if insert_sql is None:
+            insert_sql = _build_insert_sql(target_table, columns)
+            self._insert_sql_cache[key] = insert_sql
+        return insert_sql
     
     def insert_raw_data(self, room_list: List[Dict[str, Any]], target_table: Optional[str] = None) -> bool:
         """
@@ -378,39 +796,82 @@ class DataManager:
             bool: 插入是否成功
         """
         if not room_list:
-            logging.warning("数据列表为空，无需插入")
-            print("数据列表为空，无需插入")
+            logger.warning("数据列表为空，无需插入")
             return True
 
-        columns = room_list[0].keys()
-        columns_str = ", ".join(columns)
-        placeholders = ", ".join([f"%({col})s" for col in columns])
+        # 获取连接前一次性完成行转换，缩短连接占用时间
+        columns, rows = _rows_to_tuples(room_list)
 
-        # 插入SQL
-        insert_sql = f"""
-            INSERT INTO {target_table} ({columns_str})
-            VALUES ({placeholders})
-        """
+        copy_threshold = self.config_manager.copy_threshold
+        if len(rows) > copy_threshold:
+            logger.info("数据量 %s 超过阈值 %s，使用COPY导入", len(rows), copy_threshold)
+            return self._copy_tuples(columns, rows, target_table)
+
+        insert_sql = self._get_insert_sql(target_table, columns)
 
         try:
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
 
                 # 从配置文件获取批处理大小
-                batch_size = self.config_manager.get_batch_size()
-                logging.info(f"使用批处理大小: {batch_size}")
+                batch_size = self.config_manager.batch_size
+                logger.info("使用批处理大小: %s", batch_size)
                 
-                # 批量插入（直接传入原始字典列表）
-                execute_batch(cursor, insert_sql, room_list, page_size=batch_size)
+                # 多行VALUES批量插入
+                execute_values(cursor, insert_sql, rows, page_size=batch_size)
                 conn.commit()
                 
-                logging.info(f"成功插入 {len(room_list)} 条原始数据")
-                print(f"成功插入 {len(room_list)} 条原始数据")
+                logger.info("成功插入 %s 条原始数据", len(room_list))
                 return True
                 
         except Exception as e:
-            logging.error(f"插入失败: {str(e)}")
-            print(f"插入失败: {str(e)}")
+            logger.error("插入失败: %s", e)
+            return False
+    
+    def copy_raw_data(self, room_list: List[Dict[str, Any]], target_table: str) -> bool:
+        """
+        使用COPY批量导入原始数据
+        
+        Args:
+            room_list (List[Dict[str, Any]]): 房间数据列表
+            target_table (str): 目标表名
+            
+        Returns:
+            bool: 导入是否成功
+        """
+        if not room_list:
+            logger.warning("数据列表为空，无需导入")
+            return True
+
+        columns, rows = _rows_to_tuples(room_list)
+        return self._copy_tuples(columns, rows, target_table)
+    
+    def _copy_tuples(self, columns: Tuple[str, ...], rows: List[Tuple[Any, ...]], target_table: str) -> bool:
+        """
+        使用COPY批量导入已转换的元组行
+        
+        Args:
+            columns: 列名元组
+            rows: 元组行列表
+            target_table: 目标表名
+            
+        Returns:
+            bool: 导入是否成功
+        """
+        try:
+            # 获取连接前完成数据编码，缩短连接占用时间
+            buffer = _build_copy_buffer(rows)
+            
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.cursor()
+                _copy_rows(cursor, target_table, columns, buffer)
+                conn.commit()
+                
+                logger.info("成功COPY导入 %s 条原始数据", len(rows))
+                return True
+                
+        except Exception as e:
+            logger.error("COPY导入失败: %s", e)
             return False
 
 
@@ -421,33 +882,49 @@ class AgodaDataPipeline:
     
     def __init__(self, config_path: Optional[Path] = None):
         self.config_manager = ConfigManager(config_path)
+        # 运行模式在构造时确定，配置文件变更自动重新加载后不会切换已创建的管理器
+        self._threading_enabled = self.config_manager.is_threading_enabled()
         
         # 根据配置选择使用单线程还是多线程模式
-        if self.config_manager.is_threading_enabled():
+        if self._threading_enabled:
             self.connection_pool_manager = ConnectionPoolManager(self.config_manager)
             self.threaded_data_manager = ThreadedDataManager(self.connection_pool_manager, self.config_manager)
-            logging.info("初始化为多线程模式")
+            logger.info("初始化为多线程模式")
         else:
             self.db_manager = DatabaseManager(self.config_manager)
             self.data_manager = DataManager(self.db_manager, self.config_manager)
-            logging.info("初始化为单线程模式")
+            # 强制多线程插入时按需创建的连接池与多线程管理器，创建后在管道生命周期内复用
+            self._fallback_pool_manager: Optional[ConnectionPoolManager] = None
+            self._fallback_threaded_manager: Optional[ThreadedDataManager] = None
+            self._fallback_lock = threading.Lock()
+            logger.info("初始化为单线程模式")
         
-        self.table_manager = TableManager(self._get_database_manager(), self.config_manager)
+        # 表操作复用当前模式下已有的连接来源，多线程模式直接从连接池取连接
+        if self._threading_enabled:
+            self.table_manager = TableManager(self.connection_pool_manager, self.config_manager)
+        else:
+            self.table_manager = TableManager(self.db_manager, self.config_manager)
         
-        logging.info("Agoda数据管道初始化完成")
+        logger.info("Agoda数据管道初始化完成")
     
-    def _get_database_manager(self):
+    def _get_fallback_threaded_manager(self) -> ThreadedDataManager:
         """
-        获取数据库管理器（用于创建表等操作）
+        获取单线程模式下用于强制多线程插入的多线程数据管理器（首次调用时创建）
         
         Returns:
-            数据库管理器
+            ThreadedDataManager: 多线程数据管理器
         """
-        if self.config_manager.is_threading_enabled():
-            # 对于表操作，使用单连接模式
-            return DatabaseManager(self.config_manager)
-        else:
-            return self.db_manager
+        if self._fallback_threaded_manager is None:
+            with self._fallback_lock:
+                if self._fallback_threaded_manager is None:
+                    if self._fallback_pool_manager is None:
+                        # 创建后立即被调用方使用，预热无法先于首次插入完成
+                        self._fallback_pool_manager = ConnectionPoolManager(self.config_manager, warm_up=False)
+                    self._fallback_threaded_manager = ThreadedDataManager(
+                        self._fallback_pool_manager, self.config_manager
+                    )
+                    logger.info("已创建强制多线程插入使用的连接池与多线程管理器")
+        return self._fallback_threaded_manager
     
     def create_table(self, table_name: Optional[str] = None) -> bool:
         """
@@ -475,7 +952,7 @@ class AgodaDataPipeline:
         if target_table is None:
             target_table = self.config_manager.get_table_name()
         
-        if self.config_manager.is_threading_enabled():
+        if self._threading_enabled:
             return self.threaded_data_manager.insert_raw_data_threaded(room_list, target_table)
         else:
             return self.data_manager.insert_raw_data(room_list, target_table)
@@ -495,10 +972,13 @@ class AgodaDataPipeline:
             target_table = self.config_manager.get_table_name()
         
         # 如果当前是多线程模式，临时创建单线程管理器
-        if self.config_manager.is_threading_enabled():
+        if self._threading_enabled:
             temp_database_manager = DatabaseManager(self.config_manager)
             temp_data_manager = DataManager(temp_database_manager, self.config_manager)
-            return temp_data_manager.insert_raw_data(room_list, target_table)
+            try:
+                return temp_data_manager.insert_raw_data(room_list, target_table)
+            finally:
+                temp_database_manager.close()
         else:
             return self.data_manager.insert_raw_data(room_list, target_table)
     
@@ -516,17 +996,12 @@ class AgodaDataPipeline:
         if target_table is None:
             target_table = self.config_manager.get_table_name()
         
-        # 如果当前是单线程模式，临时创建多线程管理器
-        if not self.config_manager.is_threading_enabled():
-            temp_connection_pool_manager = ConnectionPoolManager(self.config_manager)
-            temp_threaded_data_manager = ThreadedDataManager(temp_connection_pool_manager, self.config_manager)
+        # 如果当前是单线程模式，使用按需创建并复用的多线程管理器
+        if not self._threading_enabled:
             try:
-                result = temp_threaded_data_manager.insert_raw_data_threaded(room_list, target_table)
-                temp_connection_pool_manager.close_pool()
-                return result
+                return self._get_fallback_threaded_manager().insert_raw_data_threaded(room_list, target_table)
             except Exception as e:
-                logging.error(f"强制多线程插入失败: {str(e)}")
-                temp_connection_pool_manager.close_pool()
+                logger.error("强制多线程插入失败: %s", e)
                 return False
         else:
             return self.threaded_data_manager.insert_raw_data_threaded(room_list, target_table)
@@ -535,9 +1010,18 @@ class AgodaDataPipeline:
         """
         关闭资源
         """
-        if self.config_manager.is_threading_enabled() and hasattr(self, 'connection_pool_manager'):
+        if self._threading_enabled and hasattr(self, 'connection_pool_manager'):
+            self.threaded_data_manager.close()
             self.connection_pool_manager.close_pool()
-            logging.info("连接池已关闭")
+            logger.info("连接池已关闭")
+        elif hasattr(self, 'db_manager'):
+            self.db_manager.close()
+            if self._fallback_threaded_manager is not None:
+                self._fallback_threaded_manager.close()
+                self._fallback_threaded_manager = None
+            if self._fallback_pool_manager is not None:
+                self._fallback_pool_manager.close_pool()
+                self._fallback_pool_manager = None
     
     def __enter__(self):
         return self
@@ -547,6 +1031,27 @@ class AgodaDataPipeline:
 
 
 # 向后兼容的函数接口
+_default_pipeline: Optional[AgodaDataPipeline] = None
+_default_pipeline_lock = threading.Lock()
+
+
+def _get_default_pipeline() -> AgodaDataPipeline:
+    """
+    获取进程级共享的数据管道实例（首次调用时创建，进程退出时关闭）
+    
+    Returns:
+        AgodaDataPipeline: 共享的数据管道实例
+    """
+    global _default_pipeline
+    if _default_pipeline is None:
+        with _default_pipeline_lock:
+            if _default_pipeline is None:
+                _default_pipeline = AgodaDataPipeline()
+                atexit.register(_default_pipeline.close)
+                logger.info("默认数据管道实例已创建")
+    return _default_pipeline
+
+
 def create_table(table_name: Optional[str] = None) -> bool:
     """
     创建表的向后兼容函数
@@ -557,8 +1062,7 @@ def create_table(table_name: Optional[str] = None) -> bool:
     Returns:
         bool: 创建是否成功
     """
-    with AgodaDataPipeline() as pipeline:
-        return pipeline.create_table(table_name)
+    return _get_default_pipeline().create_table(table_name)
 
 
 def insert_raw_data(room_list: List[Dict[str, Any]]) -> bool:
@@ -571,8 +1075,7 @@ def insert_raw_data(room_list: List[Dict[str, Any]]) -> bool:
     Returns:
         bool: 插入是否成功
     """
-    with AgodaDataPipeline() as pipeline:
-        return pipeline.insert_data(room_list)
+    return _get_default_pipeline().insert_data(room_list)
 
 
 def insert_raw_data_threaded(room_list: List[Dict[str, Any]], target_table: Optional[str] = None) -> bool:
@@ -586,8 +1089,7 @@ def insert_raw_data_threaded(room_list: List[Dict[str, Any]], target_table: Opti
     Returns:
         bool: 插入是否成功
     """
-    with AgodaDataPipeline() as pipeline:
-        return pipeline.insert_data_multi_thread(room_list, target_table)
+    return _get_default_pipeline().insert_data_multi_thread(room_list, target_table)
 
 
 # 使用示例
@@ -604,9 +1106,9 @@ if __name__ == "__main__":
         success = pipeline.create_table()
         
         if success:
-            logging.info("表创建成功，可以继续进行数据插入操作")
+            logger.info("表创建成功，可以继续进行数据插入操作")
         else:
-            logging.error("表创建失败，请检查配置和数据库连接")
+            logger.error("表创建失败，请检查配置和数据库连接")
         
         # # 执行插入（示例）
         # sample_data = [
@@ -0,0 +1,88 @@
+"""
+COPY导入与INSERT插入的存储一致性测试
+
+    python -m unittest tests.test_copy_encoding
+"""
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Tuple
+
+import psycopg2
+
+from config.config_manager import ConfigManager
+from pg_room import DatabaseManager, DataManager, _copy_text_value
+
+# 覆盖各类标量字段的样例数据，列均为VARCHAR，比对两条路径实际存储的文本
+_SAMPLE_ROWS = [
+    {'room_id': 'A1', 'price': 199, 'smoking': True, 'breakfast': False, 'cancel': None},
+    {'room_id': 'A2', 'price': 88.5, 'smoking': False, 'breakfast': 'tab\there', 'cancel': 'line\nbreak'},
+    {'room_id': 'A3', 'price': Decimal('120.10'), 'smoking': None, 'breakfast': 'back\\slash', 'cancel': True},
+    {'room_id': 'A4', 'price': float('nan'), 'smoking': True, 'breakfast': '', 'cancel': '免费取消'},
+]
+
+
+class CopyTextValueTest(unittest.TestCase):
+    """COPY字段编码与psycopg2的INSERT适配结果一致"""
+
+    def test_scalar_encoding(self) -> None:
+        cases = [
+            (None, '\\N'),
+            (True, 'true'),
+            (False, 'false'),
+            (3, '3'),
+            (2.5, '2.5'),
+            (float('nan'), 'NaN'),
+            (float('-inf'), '-Infinity'),
+            (Decimal('1.10'), '1.10'),
+            (Decimal('NaN'), 'NaN'),
+            ('a\tb\\c\nd', 'a\\tb\\\\c\\nd'),
+        ]
+        for value, expected in cases:
+            with self.subTest(value=value):
+                self.assertEqual(_copy_text_value(value), expected)
+
+    def test_rejects_non_scalar(self) -> None:
+        for value in ({'a': 1}, [1, 2], b'raw', datetime(2024, 1, 1)):
+            with self.subTest(value=value):
+                with self.assertRaises(TypeError):
+                    _copy_text_value(value)
+
+
+class CopyInsertConsistencyTest(unittest.TestCase):
+    """同一批数据经INSERT与COPY写入后存储的值相同（需要可连接的数据库）"""
+
+    def setUp(self) -> None:
+        self.db_manager = DatabaseManager(ConfigManager())
+        try:
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.cursor()
+                for table in ('copy_check_insert', 'copy_check_copy'):
+                    cursor.execute(
+                        f"CREATE TEMP TABLE {table} ("
+                        "room_id VARCHAR(50), price VARCHAR(50), smoking VARCHAR(50), "
+                        "breakfast VARCHAR(500), cancel VARCHAR(500))"
+                    )
+                conn.commit()
+        except psycopg2.OperationalError as e:
+            self.db_manager.close()
+            self.skipTest(f"数据库不可用: {e}")
+        self.data_manager = DataManager(self.db_manager, self.db_manager.config_manager)
+
+    def tearDown(self) -> None:
+        self.db_manager.close()
+
+    def _fetch(self, table: str) -> List[Tuple[str, ...]]:
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT room_id, price, smoking, breakfast, cancel FROM {table} ORDER BY room_id")
+            return cursor.fetchall()
+
+    def test_insert_and_copy_store_identical_values(self) -> None:
+        self.assertTrue(self.data_manager.insert_raw_data(_SAMPLE_ROWS, 'copy_check_insert'))
+        self.assertTrue(self.data_manager.copy_raw_data(_SAMPLE_ROWS, 'copy_check_copy'))
+        self.assertEqual(self._fetch('copy_check_insert'), self._fetch('copy_check_copy'))
+
+
+if __name__ == '__main__':
+    unittest.main()